@@ -1623,6 +1623,43 @@ class DataConverter:
         return batch_result
 
 
+def convert_data_in_process(
+    input_path: Path,
+    output_path: Path,
+    output_format: DataFormat,
+    options: DataConversionOptions,
+) -> ConversionResult:
+    """
+    Convert a data file; entry point for worker processes.
+
+    Module-level so it can be pickled, and kept out of the GUI module so
+    worker processes don't import tkinter. Progress callbacks cannot cross
+    the process boundary, so none is passed.
+
+    Args:
+        input_path: Path to input data file.
+        output_path: Path for output data file.
+        output_format: Target data format.
+        options: Data conversion options.
+
+    Returns:
+        ConversionResult with conversion details.
+
+    Raises:
+        ConversionError: If the conversion fails.
+    """
+    try:
+        return DataConverter().convert(
+            input_path,
+            output_path,
+            output_format=output_format,
+            options=options,
+        )
+    except ConversionError as e:
+        # Subclasses take extra constructor arguments and don't unpickle
+        raise ConversionError(str(e)) from None
+
+
 # =============================================================================
 # Unified Converter Factory
 # =============================================================================
@@ -16,9 +16,16 @@ Or import and run:
 from __future__ import annotations
 
 import os
+import queue
+import re
 import sys
 import threading
+import time
 import logging
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from pathlib import Path
 from typing import (
     Callable,
@@ -30,8 +37,12 @@ from typing import (
 )
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property, lru_cache
+from itertools import chain
+from types import SimpleNamespace
 
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, filedialog, messagebox
 
 # Configure module logger
@@ -51,6 +62,17 @@ WINDOW_MIN_HEIGHT = 700
 WINDOW_DEFAULT_WIDTH = 1000
 WINDOW_DEFAULT_HEIGHT = 750
 
+# How often (ms) the UI thread drains updates posted by the conversion worker
+UI_POLL_INTERVAL_MS = 50
+
+# Minimum seconds between per-chunk progress posts from the converters
+PROGRESS_POST_INTERVAL = 1 / 30
+
+# Files converted concurrently. Pillow releases the GIL while decoding and
+# encoding; pypdf is pure Python, so documents gain nothing from this and are
+# converted one at a time.
+MAX_CONVERSION_WORKERS = min(8, os.cpu_count() or 1)
+
 # UI Constants
 PADDING_SMALL = 5
 PADDING_MEDIUM = 10
@@ -114,6 +136,25 @@ class ThemeColors:
     PROGRESS_FG = "#7c3aed"
 
 
+# Tcl list of dropped paths: brace-quoted items (paths with spaces) or bare words
+_DND_LIST_RE = re.compile(r'\{([^}]+)\}|(\S+)')
+
+
+# Display text for each file status in the file list
+_STATUS_DISPLAY = {
+    "pending": "Pending",
+    "converting": "Converting...",
+    "success": "Done",
+    "error": "Error",
+}
+
+# Tcl lambda for FileListView._flush_updates: sets the status column for
+# each (iid, text) pair
+_SET_STATUS_LAMBDA = (
+    "{w pairs} {foreach {iid text} $pairs {catch {$w set $iid status $text}}}"
+)
+
+
 # Format mapping for conversion
 FORMAT_CATEGORIES = {
     "image": {
@@ -134,6 +175,40 @@ FORMAT_CATEGORIES = {
 }
 
 
+# Reverse lookup: input file extension -> format category
+EXT_TO_CATEGORY = {
+    ext: category
+    for category, info in FORMAT_CATEGORIES.items()
+    for ext in info["extensions"]
+}
+
+
+def _glob_patterns(*categories: str) -> str:
+    """Join the extensions of the given categories into a dialog pattern."""
+    return ";".join(
+        f"*{ext}" for ext, category in EXT_TO_CATEGORY.items()
+        if not categories or category in categories
+    )
+
+
+# File type filters for the input file dialog
+_FILE_DIALOG_FILETYPES = (
+    ("All Supported", _glob_patterns()),
+    ("Images", _glob_patterns("image")),
+    ("PDF Documents", _glob_patterns("document")),
+    ("Data Files", _glob_patterns("data")),
+    ("All Files", "*.*"),
+)
+
+# File extension written for each output format choice
+EXT_MAP = {
+    "PNG": ".png", "JPG": ".jpg", "JPEG": ".jpg",
+    "WEBP": ".webp", "BMP": ".bmp", "GIF": ".gif",
+    "TXT": ".txt", "PNG (pages)": ".png",
+    "CSV": ".csv", "JSON": ".json", "XLSX": ".xlsx",
+}
+
+
 # =============================================================================
 # Helper Classes
 # =============================================================================
@@ -150,6 +225,14 @@ class FileItem:
     output_path: Optional[Path] = None
 
 
+class ConversionCancelled(BaseException):
+    """Raised from a progress callback to abort a conversion in progress.
+
+    A BaseException so it passes through the converters' ``except Exception``
+    handlers instead of being logged and reported as a failure.
+    """
+
+
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human-readable format."""
     for unit in ["B", "KB", "MB", "GB"]:
@@ -161,13 +244,7 @@ def format_file_size(size_bytes: int) -> str:
 
 def get_file_category(file_path: Path) -> Optional[str]:
     """Determine the format category of a file."""
-    ext = file_path.suffix.lower()
-
-    for category, info in FORMAT_CATEGORIES.items():
-        if ext in info["extensions"]:
-            return category
-
-    return None
+    return EXT_TO_CATEGORY.get(file_path.suffix.lower())
 
 
 def get_output_formats(category: str) -> List[str]:
@@ -175,11 +252,76 @@ def get_output_formats(category: str) -> List[str]:
     return FORMAT_CATEGORIES.get(category, {}).get("outputs", [])
 
 
+@lru_cache(maxsize=8)
+def _cached_output_formats(category: str) -> Tuple[str, ...]:
+    """Immutable, memoized form of get_output_formats."""
+    return tuple(get_output_formats(category))
+
+
+@lru_cache(maxsize=32)
+def _get_font(size: int, weight: str = "bold") -> tkfont.Font:
+    """Get a shared named font; requires the root window to exist."""
+    return tkfont.Font(family=FONT_FAMILY, size=size, weight=weight)
+
+
 # =============================================================================
 # Custom Styled Widgets
 # =============================================================================
 
-class ModernButton(tk.Canvas):
+@lru_cache(maxsize=32)
+def _get_button_style(
+    bg_color: str,
+    hover_color: str,
+    pressed_color: str,
+    fg_color: str,
+    font_size: int,
+) -> str:
+    """Create (once) and return a ttk button style for a color scheme.
+
+    Hover, press and disabled looks are state maps handled by Tk itself,
+    so no Python callback runs on mouse movement.
+    """
+    style_name = "Modern_{}_{}_{}_{}_{}.TButton".format(
+        bg_color.lstrip("#"),
+        hover_color.lstrip("#"),
+        pressed_color.lstrip("#"),
+        fg_color.lstrip("#"),
+        font_size,
+    )
+    style = ttk.Style()
+
+    style.configure(
+        style_name,
+        background=bg_color,
+        foreground=fg_color,
+        font=_get_font(font_size),
+        anchor=tk.CENTER,
+        borderwidth=0,
+        focusthickness=0,
+        relief=tk.FLAT,
+    )
+
+    # clam draws its bevel with these colors; keep them matched to the
+    # background so the button stays flat in every state
+    state_colors = [
+        ("disabled", ThemeColors.BG_TERTIARY),
+        ("pressed", pressed_color),
+        ("active", hover_color),
+        ("!disabled", bg_color),
+    ]
+    style.map(
+        style_name,
+        background=state_colors,
+        lightcolor=state_colors,
+        darkcolor=state_colors,
+        bordercolor=state_colors,
+        foreground=[("disabled", ThemeColors.FG_MUTED)],
+    )
+
+    return style_name
+
+
+class ModernButton(ttk.Button):
     """A modern styled button with hover effects."""
 
     def __init__(
@@ -194,145 +336,45 @@ class ModernButton(tk.Canvas):
         pressed_color: str = ThemeColors.ACCENT_PRESSED,
         fg_color: str = ThemeColors.FG_PRIMARY,
         font_size: int = FONT_SIZE_NORMAL,
-        corner_radius: int = 4,
         disabled: bool = False,
         **kwargs
     ):
+        # ttk sizes the label in average character widths; convert the
+        # requested pixel size and make up the height with padding
+        font = _get_font(font_size)
+        char_width = max(1, font.measure("0"))
+        pad_y = max(0, (height - font.metrics("linespace")) // 2)
+
         super().__init__(
             parent,
-            width=width,
-            height=height,
-            bg=parent.cget("bg") if hasattr(parent, "cget") else ThemeColors.BG_PRIMARY,
-            highlightthickness=0,
+            text=text,
+            command=command,
+            style=_get_button_style(bg_color, hover_color, pressed_color, fg_color, font_size),
+            width=max(1, width // char_width),
+            padding=(0, pad_y),
+            cursor="hand2",
+            takefocus=False,
             **kwargs
         )
 
         self.text = text
-        self.command = command
-        self._width = width
-        self._height = height
-        self.bg_color = bg_color
-        self.hover_color = hover_color
-        self.pressed_color = pressed_color
-        self.fg_color = fg_color
-        self.font_size = font_size
-        self.corner_radius = corner_radius
-        self._disabled = disabled
-        self._current_bg = bg_color
-
-        self._draw_button()
-        self._bind_events()
-
-    def _draw_button(self):
-        """Draw the button with rounded corners."""
-        self.delete("all")
-
-        r = self.corner_radius
-        w = self._width - 1
-        h = self._height - 1
-
-        # Draw rounded rectangle using arcs and rectangle fills
-        # This creates a smoother, more square appearance
-
-        # Main rectangle (center)
-        self.create_rectangle(
-            r, 0, w - r, h,
-            fill=self._current_bg, outline=""
-        )
-        # Left and right sides
-        self.create_rectangle(
-            0, r, r, h - r,
-            fill=self._current_bg, outline=""
-        )
-        self.create_rectangle(
-            w - r, r, w, h - r,
-            fill=self._current_bg, outline=""
-        )
-
-        # Corner arcs (pie slices for smooth rounded corners)
-        # Top-left
-        self.create_arc(
-            0, 0, r * 2, r * 2,
-            start=90, extent=90,
-            fill=self._current_bg, outline=""
-        )
-        # Top-right
-        self.create_arc(
-            w - r * 2, 0, w, r * 2,
-            start=0, extent=90,
-            fill=self._current_bg, outline=""
-        )
-        # Bottom-left
-        self.create_arc(
-            0, h - r * 2, r * 2, h,
-            start=180, extent=90,
-            fill=self._current_bg, outline=""
-        )
-        # Bottom-right
-        self.create_arc(
-            w - r * 2, h - r * 2, w, h,
-            start=270, extent=90,
-            fill=self._current_bg, outline=""
-        )
-
-        # Draw text
-        self.create_text(
-            (w + 1) // 2,
-            (h + 1) // 2,
-            text=self.text,
-            fill=self.fg_color if not self._disabled else ThemeColors.FG_MUTED,
-            font=(FONT_FAMILY, self.font_size, "bold"),
-            tags="text"
-        )
-
-    def _bind_events(self):
-        """Bind mouse events for hover and click effects."""
-        self.bind("<Enter>", self._on_enter)
-        self.bind("<Leave>", self._on_leave)
-        self.bind("<Button-1>", self._on_press)
-        self.bind("<ButtonRelease-1>", self._on_release)
-
-    def _on_enter(self, event):
-        if not self._disabled:
-            self._current_bg = self.hover_color
-            self._draw_button()
-            self.config(cursor="hand2")
-
-    def _on_leave(self, event):
-        if not self._disabled:
-            self._current_bg = self.bg_color
-            self._draw_button()
-            self.config(cursor="")
-
-    def _on_press(self, event):
-        if not self._disabled:
-            self._current_bg = self.pressed_color
-            self._draw_button()
-
-    def _on_release(self, event):
-        if not self._disabled:
-            self._current_bg = self.hover_color
-            self._draw_button()
-            if self.command:
-                self.command()
+        self._disabled = False
+        if disabled:
+            self.set_disabled(True)
 
     def set_disabled(self, disabled: bool):
         """Enable or disable the button."""
         self._disabled = disabled
-        if disabled:
-            self._current_bg = ThemeColors.BG_TERTIARY
-        else:
-            self._current_bg = self.bg_color
-        self._draw_button()
+        self.state(["disabled"] if disabled else ["!disabled"])
         self.config(cursor="" if disabled else "hand2")
 
     def set_text(self, text: str):
         """Update button text."""
         self.text = text
-        self._draw_button()
+        self.config(text=text)
 
 
-class ModernEntry(tk.Frame):
+class ModernEntry(tk.Entry):
     """A modern styled entry field with placeholder support."""
 
     def __init__(
@@ -342,79 +384,72 @@ class ModernEntry(tk.Frame):
         width: int = 200,
         **kwargs
     ):
-        super().__init__(parent, bg=ThemeColors.BG_INPUT, **kwargs)
-
-        self.placeholder = placeholder
-        self._has_focus = False
-        self._showing_placeholder = True
-
-        # Create inner frame for border effect
-        self.inner_frame = tk.Frame(
-            self,
-            bg=ThemeColors.BG_INPUT,
-            highlightbackground=ThemeColors.BORDER_DEFAULT,
-            highlightthickness=1,
-            highlightcolor=ThemeColors.BORDER_FOCUS,
-        )
-        self.inner_frame.pack(fill=tk.BOTH, expand=True, padx=1, pady=1)
-
-        # Create entry widget
-        self.entry = tk.Entry(
-            self.inner_frame,
+        # The border is the entry's own highlight ring; a flat border of the
+        # background color provides the inner padding.
+        super().__init__(
+            parent,
             bg=ThemeColors.BG_INPUT,
             fg=ThemeColors.FG_PLACEHOLDER,
             insertbackground=ThemeColors.FG_PRIMARY,
-            font=(FONT_FAMILY, FONT_SIZE_NORMAL),
+            font=_get_font(FONT_SIZE_NORMAL, "normal"),
             relief=tk.FLAT,
+            borderwidth=6,
+            highlightthickness=1,
+            highlightbackground=ThemeColors.BORDER_DEFAULT,
+            highlightcolor=ThemeColors.BORDER_FOCUS,
             width=width // 8,
+            **kwargs
         )
-        self.entry.pack(fill=tk.BOTH, expand=True, padx=8, pady=6)
+
+        self.placeholder = placeholder
+        self._has_focus = False
+        self._showing_placeholder = True
 
         # Show placeholder
         if placeholder:
-            self.entry.insert(0, placeholder)
+            self.insert(0, placeholder)
 
         # Bind events
-        self.entry.bind("<FocusIn>", self._on_focus_in)
-        self.entry.bind("<FocusOut>", self._on_focus_out)
+        self.bind("<FocusIn>", self._on_focus_in)
+        self.bind("<FocusOut>", self._on_focus_out)
 
     def _on_focus_in(self, event):
         self._has_focus = True
         if self._showing_placeholder:
-            self.entry.delete(0, tk.END)
-            self.entry.config(fg=ThemeColors.FG_PRIMARY)
+            self.delete(0, tk.END)
+            self.config(fg=ThemeColors.FG_PRIMARY)
             self._showing_placeholder = False
-        self.inner_frame.config(highlightbackground=ThemeColors.BORDER_FOCUS)
+        self.config(highlightbackground=ThemeColors.BORDER_FOCUS)
 
     def _on_focus_out(self, event):
         self._has_focus = False
-        if not self.entry.get():
-            self.entry.insert(0, self.placeholder)
-            self.entry.config(fg=ThemeColors.FG_PLACEHOLDER)
+        if not super().get():
+            self.insert(0, self.placeholder)
+            self.config(fg=ThemeColors.FG_PLACEHOLDER)
             self._showing_placeholder = True
-        self.inner_frame.config(highlightbackground=ThemeColors.BORDER_DEFAULT)
+        self.config(highlightbackground=ThemeColors.BORDER_DEFAULT)
 
     def get(self) -> str:
         """Get the entry value (excluding placeholder)."""
         if self._showing_placeholder:
             return ""
-        return self.entry.get()
+        return super().get()
 
     def set(self, value: str):
         """Set the entry value."""
-        self.entry.delete(0, tk.END)
+        self.delete(0, tk.END)
         if value:
-            self.entry.insert(0, value)
-            self.entry.config(fg=ThemeColors.FG_PRIMARY)
+            self.insert(0, value)
+            self.config(fg=ThemeColors.FG_PRIMARY)
             self._showing_placeholder = False
         else:
-            self.entry.insert(0, self.placeholder)
-            self.entry.config(fg=ThemeColors.FG_PLACEHOLDER)
+            self.insert(0, self.placeholder)
+            self.config(fg=ThemeColors.FG_PLACEHOLDER)
             self._showing_placeholder = True
 
     def set_state(self, state: str):
         """Set the state of the entry ('normal' or 'disabled')."""
-        self.entry.config(state=state)
+        self.config(state=state)
 
 
 class ModernScale(tk.Frame):
@@ -433,7 +468,7 @@ class ModernScale(tk.Frame):
         super().__init__(parent, bg=ThemeColors.BG_SECONDARY, **kwargs)
 
         self.command = command
-        self._value = tk.IntVar(value=value)
+        self._value_int = value
 
         # Label row
         if label:
@@ -463,23 +498,27 @@ class ModernScale(tk.Frame):
             from_=from_,
             to=to,
             orient=tk.HORIZONTAL,
-            variable=self._value,
+            value=value,
             command=self._on_change,
         )
         self.scale.pack(fill=tk.X)
 
     def _on_change(self, value):
         int_value = int(float(value))
+        if int_value == self._value_int:
+            return  # Sub-step drag movement; the displayed value is unchanged
+        self._value_int = int_value
         if hasattr(self, 'value_label'):
             self.value_label.config(text=str(int_value))
         if self.command:
             self.command(int_value)
 
     def get(self) -> int:
-        return self._value.get()
+        return self._value_int
 
     def set(self, value: int):
-        self._value.set(value)
+        self._value_int = value
+        self.scale.set(value)
         if hasattr(self, 'value_label'):
             self.value_label.config(text=str(value))
 
@@ -499,7 +538,7 @@ class ModernCombobox(tk.Frame):
         super().__init__(parent, bg=ThemeColors.BG_SECONDARY, **kwargs)
 
         self.command = command
-        self._value = tk.StringVar(value=default)
+        self._value = default
 
         if label:
             tk.Label(
@@ -513,26 +552,31 @@ class ModernCombobox(tk.Frame):
         # Combobox
         self.combobox = ttk.Combobox(
             self,
-            textvariable=self._value,
             values=values or [],
             state="readonly",
             font=(FONT_FAMILY, FONT_SIZE_NORMAL),
         )
+        self.combobox.set(default)
         self.combobox.pack(fill=tk.X)
 
-        if command:
-            self.combobox.bind("<<ComboboxSelected>>", lambda e: command(self._value.get()))
+        self.combobox.bind("<<ComboboxSelected>>", self._on_selected)
+
+    def _on_selected(self, event):
+        self._value = self.combobox.get()
+        if self.command:
+            self.command(self._value)
 
     def get(self) -> str:
-        return self._value.get()
+        return self._value
 
     def set(self, value: str):
-        self._value.set(value)
+        self._value = value
+        self.combobox.set(value)
 
     def set_values(self, values: List[str]):
         self.combobox["values"] = values
-        if values and not self._value.get():
-            self._value.set(values[0])
+        if values and not self._value:
+            self.set(values[0])
 
     def set_state(self, state: str):
         self.combobox.config(state=state)
@@ -565,40 +609,30 @@ class DropZone(tk.Canvas):
         self._width = width
         self._height = height
         self._is_active = False
+        self._redraw_pending = False
 
-        self._draw_content()
+        self._create_content()
         self._bind_events()
         self._setup_dnd()
 
-    def _draw_content(self):
-        """Draw the drop zone content."""
-        self.delete("all")
-
+    def _create_content(self):
+        """Create the drop zone items once; state changes only reconfigure them."""
         center_x = self._width // 2
         center_y = self._height // 2 - 20
 
-        # Draw dashed border
-        dash_pattern = (8, 4)
-        border_color = ThemeColors.DROP_ZONE_BORDER_ACTIVE if self._is_active else ThemeColors.DROP_ZONE_BORDER
-
         # Draw icon (folder/file icon using text)
-        icon_text = "+"
         self.create_text(
             center_x,
             center_y - 20,
-            text=icon_text,
-            fill=ThemeColors.ACCENT_LIGHT if self._is_active else ThemeColors.FG_MUTED,
+            text="+",
             font=(FONT_FAMILY, 36, "bold"),
             tags="icon"
         )
 
         # Draw primary text
-        primary_text = "Drop files here" if self._is_active else "Drag & Drop Files Here"
         self.create_text(
             center_x,
             center_y + 30,
-            text=primary_text,
-            fill=ThemeColors.FG_PRIMARY if self._is_active else ThemeColors.FG_SECONDARY,
             font=(FONT_FAMILY, FONT_SIZE_LARGE, "bold"),
             tags="primary"
         )
@@ -623,6 +657,20 @@ class DropZone(tk.Canvas):
             tags="formats"
         )
 
+        self._update_state()
+
+    def _update_state(self):
+        """Apply the active/inactive colors and text to the existing items."""
+        self.itemconfig(
+            "icon",
+            fill=ThemeColors.ACCENT_LIGHT if self._is_active else ThemeColors.FG_MUTED,
+        )
+        self.itemconfig(
+            "primary",
+            text="Drop files here" if self._is_active else "Drag & Drop Files Here",
+            fill=ThemeColors.FG_PRIMARY if self._is_active else ThemeColors.FG_SECONDARY,
+        )
+
     def _bind_events(self):
         """Bind mouse events."""
         self.bind("<Button-1>", self._on_click)
@@ -641,6 +689,16 @@ class DropZone(tk.Canvas):
             # tkinterdnd2 not available
             pass
 
+    def _schedule_redraw(self):
+        """Coalesce repeated drag events into a single idle-time redraw."""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._flush_redraw)
+
+    def _flush_redraw(self):
+        self._redraw_pending = False
+        self._update_state()
+
     def _on_click(self, event):
         self.on_browse()
 
@@ -656,7 +714,7 @@ class DropZone(tk.Canvas):
             bg=ThemeColors.DROP_ZONE_ACTIVE,
             highlightbackground=ThemeColors.DROP_ZONE_BORDER_ACTIVE
         )
-        self._draw_content()
+        self._schedule_redraw()
         return event.action
 
     def _on_drag_leave(self, event):
@@ -665,7 +723,7 @@ class DropZone(tk.Canvas):
             bg=ThemeColors.DROP_ZONE_BG,
             highlightbackground=ThemeColors.DROP_ZONE_BORDER
         )
-        self._draw_content()
+        self._schedule_redraw()
 
     def _on_dnd_drop(self, event):
         self._is_active = False
@@ -673,7 +731,7 @@ class DropZone(tk.Canvas):
             bg=ThemeColors.DROP_ZONE_BG,
             highlightbackground=ThemeColors.DROP_ZONE_BORDER
         )
-        self._draw_content()
+        self._schedule_redraw()
 
         # Parse dropped files
         files = self._parse_drop_data(event.data)
@@ -684,25 +742,16 @@ class DropZone(tk.Canvas):
 
     def _parse_drop_data(self, data: str) -> List[str]:
         """Parse the dropped file data."""
-        files = []
-
         # Handle different formats
         if data.startswith("{"):
             # Tcl list format with braces
-            import re
-            matches = re.findall(r'\{([^}]+)\}|(\S+)', data)
-            for match in matches:
-                file_path = match[0] if match[0] else match[1]
-                if file_path and os.path.isfile(file_path):
-                    files.append(file_path)
+            candidates = (braced or bare for braced, bare in _DND_LIST_RE.findall(data))
         else:
             # Space-separated or newline-separated
-            for item in data.replace("\r\n", "\n").split("\n"):
-                item = item.strip()
-                if item and os.path.isfile(item):
-                    files.append(item)
+            candidates = (item.strip() for item in data.splitlines())
 
-        return files
+        isfile = os.path.isfile  # Bound once; called per dropped path
+        return [path for path in candidates if path and isfile(path)]
 
 
 class FileListView(tk.Frame):
@@ -711,13 +760,16 @@ class FileListView(tk.Frame):
     def __init__(
         self,
         parent: tk.Widget,
-        on_remove: Callable[[List[str]], None],
+        on_remove: Callable[[List[FileItem]], None],
         **kwargs
     ):
         super().__init__(parent, bg=ThemeColors.BG_SECONDARY, **kwargs)
 
         self.on_remove = on_remove
-        self._files: Dict[str, FileItem] = {}
+        # Keyed by path; the Treeview iid is str(path)
+        self._files: Dict[Path, FileItem] = {}
+        self._pending_updates: Dict[Path, Tuple[str, Optional[str]]] = {}
+        self._flush_scheduled = False
 
         # Create Treeview with scrollbar
         self.tree_frame = tk.Frame(self, bg=ThemeColors.BG_SECONDARY)
@@ -762,26 +814,19 @@ class FileListView(tk.Frame):
 
     def add_file(self, file_item: FileItem):
         """Add a file to the list."""
-        file_key = str(file_item.path)
-
-        if file_key in self._files:
+        if file_item.path in self._files:
             return  # Already exists
 
-        self._files[file_key] = file_item
+        self._files[file_item.path] = file_item
 
         # Determine status display
-        status_display = {
-            "pending": "Pending",
-            "converting": "Converting...",
-            "success": "Done",
-            "error": "Error",
-        }.get(file_item.status, file_item.status)
+        status_display = _STATUS_DISPLAY.get(file_item.status, file_item.status)
 
         # Insert into tree
         self.tree.insert(
             "",
             tk.END,
-            iid=file_key,
+            iid=str(file_item.path),
             values=(
                 file_item.path.name,
                 format_file_size(file_item.size),
@@ -790,20 +835,85 @@ class FileListView(tk.Frame):
             ),
         )
 
-    def update_file_status(self, file_path: str, status: str, error: str = None):
-        """Update the status of a file."""
-        if file_path in self._files:
-            self._files[file_path].status = status
-            self._files[file_path].error_message = error
+    def add_files(self, file_items: List[FileItem]) -> List[FileItem]:
+        """Add several files to the list at once.
+
+        Returns the items that were actually added; files already in the
+        list are skipped.
+        """
+        new_items = []
+        for file_item in file_items:
+            if file_item.path not in self._files:
+                self._files[file_item.path] = file_item
+                new_items.append(file_item)
+
+        # Format every row up front, then insert them in one tight loop
+        rows = [
+            (
+                str(item.path),
+                (
+                    item.path.name,
+                    format_file_size(item.size),
+                    item.format_type.capitalize(),
+                    _STATUS_DISPLAY.get(item.status, item.status),
+                ),
+            )
+            for item in new_items
+        ]
+        insert = self.tree.insert
+        for iid, values in rows:
+            insert("", tk.END, iid=iid, values=values)
+
+        return new_items
 
-            status_display = {
-                "pending": "Pending",
-                "converting": "Converting...",
-                "success": "Done",
-                "error": f"Error: {error[:20]}..." if error and len(error) > 20 else f"Error: {error}" if error else "Error",
-            }.get(status, status)
+    def update_file_status(self, file_path: Path, status: str, error: str = None):
+        """Update the status of a file.
 
-            self.tree.set(file_path, "status", status_display)
+        The file's state changes immediately, but the Treeview is only
+        written once per idle tick so bursts of updates share one redraw.
+        """
+        item = self._files.get(file_path)
+        if item is None:
+            return
+        if item.status == status and item.error_message == error:
+            return  # Nothing changed; skip the Treeview round-trip
+
+        item.status = status
+        item.error_message = error
+
+        # Last write wins for a file updated several times before the flush
+        self._pending_updates[file_path] = (status, error)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush_updates)
+
+    def _flush_updates(self):
+        """Write all queued status changes to the Treeview."""
+        self._flush_scheduled = False
+        pending, self._pending_updates = self._pending_updates, {}
+
+        # Flat (iid, text, iid, text, ...) sequence for a single Tcl call
+        pairs: List[str] = []
+        for file_path, (status, error) in pending.items():
+            if file_path not in self._files:
+                continue  # Removed before the flush ran
+
+            if status == "error" and error:
+                status_display = f"Error: {error[:20]}..." if len(error) > 20 else f"Error: {error}"
+            else:
+                status_display = _STATUS_DISPLAY.get(status, status)
+
+            pairs.append(str(file_path))
+            pairs.append(status_display)
+
+        if pairs:
+            # Tcl iterates the pairs itself; tkinter passes the tuple as a
+            # proper Tcl list, so paths with spaces or braces need no quoting.
+            # apply keeps the loop variables out of Tcl's global namespace,
+            # and catch lets a row removed meanwhile skip only itself.
+            self.tk.call(
+                "apply", _SET_STATUS_LAMBDA, str(self.tree), tuple(pairs),
+            )
 
     def get_files(self) -> List[FileItem]:
         """Get all files in the list."""
@@ -815,8 +925,8 @@ class FileListView(tk.Frame):
 
     def clear(self):
         """Clear all files from the list."""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # One delete call for every row instead of a Tcl round-trip per row
+        self.tree.delete(*self.tree.get_children())
         self._files.clear()
 
     def _show_context_menu(self, event):
@@ -831,23 +941,24 @@ class FileListView(tk.Frame):
     def _remove_selected(self):
         """Remove selected files."""
         selected = self.tree.selection()
-        removed_paths = []
+        removed_items = []
 
         for item in selected:
-            if item in self._files:
-                removed_paths.append(item)
-                del self._files[item]
-            self.tree.delete(item)
+            file_item = self._files.pop(Path(item), None)
+            if file_item is not None:
+                removed_items.append(file_item)
+        if selected:
+            self.tree.delete(*selected)
 
-        if removed_paths:
-            self.on_remove(removed_paths)
+        if removed_items:
+            self.on_remove(removed_items)
 
     def _clear_all(self):
         """Clear all files."""
         if messagebox.askyesno("Clear All", "Are you sure you want to clear all files?"):
-            removed_paths = list(self._files.keys())
+            removed_items = list(self._files.values())
             self.clear()
-            self.on_remove(removed_paths)
+            self.on_remove(removed_items)
 
 
 class ProgressPanel(tk.Frame):
@@ -868,10 +979,9 @@ class ProgressPanel(tk.Frame):
         self.status_label.pack(fill=tk.X, pady=(0, 8))
 
         # Progress bar
-        self.progress_var = tk.DoubleVar(value=0)
         self.progress_bar = ttk.Progressbar(
             self,
-            variable=self.progress_var,
+            value=0,
             maximum=100,
             mode="determinate",
         )
@@ -888,27 +998,54 @@ class ProgressPanel(tk.Frame):
         )
         self.details_label.pack(fill=tk.X)
 
+        # Last values written to the widgets, used to skip no-op configures
+        self._last_status: Optional[str] = "Ready"
+        self._last_progress: Optional[float] = 0
+        self._last_details: Optional[str] = ""
+
+    def update_fields(
+        self,
+        *,
+        status: Optional[str] = None,
+        progress: Optional[float] = None,
+        details: Optional[str] = None,
+    ):
+        """Update any combination of status, progress and details.
+
+        Fields left as None are not touched, and widgets are only
+        reconfigured when their value actually changes. (Named so it does
+        not shadow ``tk.Misc.update``.)
+        """
+        if status is not None and status != self._last_status:
+            self._last_status = status
+            self.status_label.config(text=status)
+        if progress is not None and progress != self._last_progress:
+            self._last_progress = progress
+            self.progress_bar.config(value=progress)
+        if details is not None and details != self._last_details:
+            self._last_details = details
+            self.details_label.config(text=details)
+
     def set_status(self, text: str):
         """Set the status text."""
-        self.status_label.config(text=text)
+        self.update_fields(status=text)
 
     def set_progress(self, value: float):
         """Set the progress value (0-100)."""
-        self.progress_var.set(value)
+        self.update_fields(progress=value)
 
     def set_details(self, text: str):
         """Set the details text."""
-        self.details_label.config(text=text)
+        self.update_fields(details=text)
 
     def reset(self):
         """Reset the progress panel."""
-        self.set_status("Ready")
-        self.set_progress(0)
-        self.set_details("")
+        self.update_fields(status="Ready", progress=0, details="")
 
     def set_indeterminate(self, enabled: bool):
         """Set the progress bar to indeterminate mode."""
         self.progress_bar.config(mode="indeterminate" if enabled else "determinate")
+        self._last_progress = None  # The animation moves the bar's value
         if enabled:
             self.progress_bar.start(10)
         else:
@@ -926,7 +1063,19 @@ class FileForgeApp:
         self.root = root
         self._conversion_thread: Optional[threading.Thread] = None
         self._is_converting = False
-        self._cancel_requested = False
+        self._cancel_event = threading.Event()
+        # Worker -> UI thread messages, drained in batches by _drain_ui_queue
+        self._ui_queue: queue.Queue = queue.Queue()
+        self._draining = False
+        # File scans still running, and the generation their results must
+        # match to be added; _clear_all bumps it to drop in-flight scans
+        self._scans_in_flight = 0
+        self._scan_generation = 0
+        # Categories the output format list was last built for
+        self._last_categories: Optional[frozenset] = None
+        # Kept in step with the file list so adds/removes never rescan it
+        self._file_count = 0
+        self._category_counts: Counter = Counter()
 
         # Configure root window
         self._configure_window()
@@ -994,27 +1143,23 @@ class FileForgeApp:
         except tk.TclError:
             pass
 
-        # Configure colors
+        # Base colors shared by every widget; the per-widget calls below
+        # only carry the options that differ from this base
         style.configure(
             ".",
             background=ThemeColors.BG_SECONDARY,
             foreground=ThemeColors.FG_PRIMARY,
             fieldbackground=ThemeColors.BG_INPUT,
+            troughcolor=ThemeColors.PROGRESS_BG,
+            arrowcolor=ThemeColors.FG_PRIMARY,
             font=(FONT_FAMILY, FONT_SIZE_NORMAL),
         )
 
         # Treeview style
-        style.configure(
-            "Treeview",
-            background=ThemeColors.BG_INPUT,
-            foreground=ThemeColors.FG_PRIMARY,
-            fieldbackground=ThemeColors.BG_INPUT,
-            rowheight=28,
-        )
+        style.configure("Treeview", background=ThemeColors.BG_INPUT, rowheight=28)
         style.configure(
             "Treeview.Heading",
             background=ThemeColors.BG_TERTIARY,
-            foreground=ThemeColors.FG_PRIMARY,
             font=(FONT_FAMILY, FONT_SIZE_NORMAL, "bold"),
         )
         style.map(
@@ -1024,31 +1169,17 @@ class FileForgeApp:
         )
 
         # Combobox style
-        style.configure(
-            "TCombobox",
-            fieldbackground=ThemeColors.BG_INPUT,
-            background=ThemeColors.BG_INPUT,
-            foreground=ThemeColors.FG_PRIMARY,
-            arrowcolor=ThemeColors.FG_PRIMARY,
-        )
+        style.configure("TCombobox", background=ThemeColors.BG_INPUT)
         style.map(
             "TCombobox",
             fieldbackground=[("readonly", ThemeColors.BG_INPUT)],
             foreground=[("readonly", ThemeColors.FG_PRIMARY)],
         )
 
-        # Scale style
-        style.configure(
-            "TScale",
-            background=ThemeColors.BG_SECONDARY,
-            troughcolor=ThemeColors.PROGRESS_BG,
-        )
-
         # Progress bar style
         style.configure(
             "TProgressbar",
             background=ThemeColors.PROGRESS_FG,
-            troughcolor=ThemeColors.PROGRESS_BG,
             borderwidth=0,
             thickness=8,
         )
@@ -1358,19 +1489,21 @@ class FileForgeApp:
         self.convert_btn.pack(side=tk.RIGHT)
 
     def _setup_converters(self):
-        """Setup converter instances."""
+        """Setup converter dispatch.
+
+        The converter instances themselves are created on first use (see
+        the properties below), since constructing them imports Pillow,
+        pypdf and pandas.
+        """
         try:
-            from fileforge.converters import (
-                ImageConverter,
-                DocumentConverter,
-                DataConverter,
-                get_supported_formats,
-            )
+            from fileforge.converters import get_supported_formats
 
-            self.image_converter = ImageConverter()
-            self.document_converter = DocumentConverter()
-            self.data_converter = DataConverter()
             self.get_supported_formats = get_supported_formats
+            self._converter_dispatch = {
+                "image": self._convert_image,
+                "document": self._convert_document,
+                "data": self._convert_data,
+            }
             self._converters_available = True
         except ImportError as e:
             logger.warning(f"Could not import converters: {e}")
@@ -1381,6 +1514,44 @@ class FileForgeApp:
                 "Make sure the fileforge package is properly installed."
             )
 
+    @cached_property
+    def image_converter(self):
+        """Image converter, created on first access."""
+        from fileforge.converters import ImageConverter
+        return ImageConverter()
+
+    @cached_property
+    def document_converter(self):
+        """Document converter, created on first access."""
+        from fileforge.converters import DocumentConverter
+        return DocumentConverter()
+
+    @cached_property
+    def data_converter(self):
+        """Data converter, created on first access."""
+        from fileforge.converters import DataConverter
+        return DataConverter()
+
+    @cached_property
+    def _conv_types(self) -> SimpleNamespace:
+        """Option and format types used by the conversion workers."""
+        from fileforge.converters import (
+            ImageConversionOptions,
+            DataConversionOptions,
+            ImageFormat,
+            DataFormat,
+            UnsupportedFormatError,
+            convert_data_in_process,
+        )
+        return SimpleNamespace(
+            convert_data_in_process=convert_data_in_process,
+            ImageConversionOptions=ImageConversionOptions,
+            DataConversionOptions=DataConversionOptions,
+            ImageFormat=ImageFormat,
+            DataFormat=DataFormat,
+            UnsupportedFormatError=UnsupportedFormatError,
+        )
+
     # =========================================================================
     # Event Handlers
     # =========================================================================
@@ -1391,55 +1562,64 @@ class FileForgeApp:
 
     def _browse_files(self):
         """Open file browser dialog."""
-        filetypes = [
-            ("All Supported", "*.png;*.jpg;*.jpeg;*.webp;*.bmp;*.gif;*.pdf;*.csv;*.json;*.xlsx;*.xls"),
-            ("Images", "*.png;*.jpg;*.jpeg;*.webp;*.bmp;*.gif"),
-            ("PDF Documents", "*.pdf"),
-            ("Data Files", "*.csv;*.json;*.xlsx;*.xls"),
-            ("All Files", "*.*"),
-        ]
-
         files = filedialog.askopenfilenames(
             title="Select Files to Convert",
-            filetypes=filetypes,
+            filetypes=_FILE_DIALOG_FILETYPES,
         )
 
         if files:
             self._add_files(list(files))
 
     def _add_files(self, file_paths: List[str]):
-        """Add files to the conversion queue."""
-        added_count = 0
-        categories_found = set()
-
-        for file_path in file_paths:
-            path = Path(file_path)
+        """Add files to the conversion queue.
+
+        The paths are checked on a background thread so that large drops,
+        or drops from slow network shares, don't block the UI.
+        """
+        self._scans_in_flight += 1
+        threading.Thread(
+            target=self._scan_files,
+            args=(file_paths, self._scan_generation),
+            daemon=True,
+        ).start()
+        self._schedule_drain()
 
-            if not path.exists():
-                continue
+    def _scan_files(self, file_paths: List[str], generation: int):
+        """Build FileItems for the supported, existing paths (worker thread)."""
+        file_items = []
 
-            category = get_file_category(path)
+        for file_path in file_paths:
+            # Filter on the raw string first; only supported files pay for
+            # a Path object and a stat() call
+            ext = os.path.splitext(file_path)[1].lower()
+            category = EXT_TO_CATEGORY.get(ext)
             if category is None:
                 continue
 
+            # A single stat() both checks existence and gives the size
             try:
-                size = path.stat().st_size
+                size = os.stat(file_path).st_size
             except OSError:
-                size = 0
+                continue
 
-            file_item = FileItem(
-                path=path,
+            file_items.append(FileItem(
+                path=Path(file_path),
                 size=size,
                 format_type=category,
-            )
+            ))
+
+        self._ui_queue.put(("scanned", generation, file_items))
 
-            self.file_list.add_file(file_item)
-            categories_found.add(category)
-            added_count += 1
+    def _on_files_scanned(self, file_items: List[FileItem]):
+        """Add scanned files to the list (UI thread)."""
+        added = self.file_list.add_files(file_items)
+        added_count = len(added)
+        categories_found = {item.format_type for item in added}
 
         # Update file count
-        total_files = len(self.file_list.get_files())
-        self.file_count_label.config(text=f"({total_files} file{'s' if total_files != 1 else ''})")
+        self._file_count += added_count
+        self._category_counts.update(item.format_type for item in added)
+        self._update_file_count_label()
 
         # Update output format options based on categories
         if categories_found:
@@ -1448,27 +1628,36 @@ class FileForgeApp:
         if added_count > 0:
             self.progress_panel.set_status(f"Added {added_count} file(s)")
 
-    def _on_files_removed(self, removed_paths: List[str]):
+    def _on_files_removed(self, removed_items: List[FileItem]):
         """Handle files removed from the list."""
-        total_files = len(self.file_list.get_files())
-        self.file_count_label.config(text=f"({total_files} file{'s' if total_files != 1 else ''})")
+        self._file_count -= len(removed_items)
+        self._category_counts.subtract(item.format_type for item in removed_items)
+        self._update_file_count_label()
 
         # Update output formats
-        if total_files > 0:
-            categories = set(f.format_type for f in self.file_list.get_files())
+        if self._file_count > 0:
+            categories = {c for c, n in self._category_counts.items() if n > 0}
             self._update_output_formats(categories)
         else:
             self.output_format.set_values([])
+            self._last_categories = None
+
+    def _update_file_count_label(self):
+        """Show the current number of queued files."""
+        total_files = self._file_count
+        self.file_count_label.config(text=f"({total_files} file{'s' if total_files != 1 else ''})")
 
     def _update_output_formats(self, categories: set):
         """Update available output formats based on selected file types."""
-        formats = []
+        categories = frozenset(categories)
+        if categories == self._last_categories:
+            return  # Combobox and options already match these categories
+        self._last_categories = categories
 
-        for category in categories:
-            category_formats = get_output_formats(category)
-            for fmt in category_formats:
-                if fmt not in formats:
-                    formats.append(fmt)
+        # dict.fromkeys de-duplicates while keeping first-seen order
+        formats = list(dict.fromkeys(chain.from_iterable(
+            _cached_output_formats(category) for category in categories
+        )))
 
         self.output_format.set_values(formats)
 
@@ -1491,9 +1680,14 @@ class FileForgeApp:
 
     def _clear_all(self):
         """Clear all files and reset the form."""
+        # Results of scans still running belong to the cleared list
+        self._scan_generation += 1
         self.file_list.clear()
-        self.file_count_label.config(text="(0 files)")
+        self._file_count = 0
+        self._category_counts.clear()
+        self._update_file_count_label()
         self.output_format.set_values([])
+        self._last_categories = None
         self.output_dir_entry.set("")
         self.width_entry.set("")
         self.height_entry.set("")
@@ -1529,10 +1723,15 @@ class FileForgeApp:
         # Disable UI during conversion
         self._set_ui_state(False)
         self._is_converting = True
-        self._cancel_requested = False
+        self._cancel_event.clear()
 
         # Show cancel button
         self.cancel_btn.pack(side=tk.RIGHT, padx=(0, PADDING_SMALL))
+        self.progress_panel.update_fields(
+            status=f"Converting {len(files)} file(s)...",
+            progress=0,
+            details="",
+        )
 
         # Start conversion in background thread
         self._conversion_thread = threading.Thread(
@@ -1541,6 +1740,7 @@ class FileForgeApp:
             daemon=True,
         )
         self._conversion_thread.start()
+        self._schedule_drain()
 
     def _parse_int(self, value: str) -> Optional[int]:
         """Parse string to int, return None if invalid."""
@@ -1550,127 +1750,334 @@ class FileForgeApp:
             return None
 
     def _run_conversion(self, files: List[FileItem], options: Dict[str, Any]):
-        """Run the conversion process in a background thread."""
-        from fileforge.converters import (
-            ImageConversionOptions,
-            DataConversionOptions,
-            ImageFormat,
-            DataFormat,
-        )
+        """Run the conversion process in a background thread.
 
+        Files are converted concurrently on a thread pool; progress is
+        reported as files complete. Files that would write the same output
+        path, and PDF documents, are converted one after another in a single
+        task.
+        """
         total = len(files)
         success_count = 0
         error_count = 0
 
         output_format = options["output_format"]
+
+        # The output format is the same for the whole batch
+        new_ext = EXT_MAP.get(output_format) or f".{output_format.lower()}"
+        options["extension"] = new_ext
+
+        # Resolve the target format enums once per batch, only for the
+        # categories present. None means "unsupported": the per-file call
+        # then raises the usual error for each affected file.
+        types = self._conv_types
+        categories = {file_item.format_type for file_item in files}
+        options["image_format"] = None
+        options["data_format"] = None
+        try:
+            if "image" in categories:
+                options["image_format"] = types.ImageFormat.from_extension(new_ext)
+        except types.UnsupportedFormatError:
+            pass
+        try:
+            if "data" in categories:
+                options["data_format"] = types.DataFormat.from_extension(new_ext)
+        except types.UnsupportedFormatError:
+            pass
+
+        # Resolve every output path up front. Inputs such as photo.png and
+        # photo.webp both become photo.jpg; converting them concurrently
+        # would interleave writes to one file, so they share a task and run
+        # in order, the last one winning.
         output_dir = options["output_dir"]
+        groups: Dict[str, List[Tuple[FileItem, Path]]] = {}
+        for file_item in files:
+            out_dir = Path(output_dir) if output_dir else file_item.path.parent
+            output_path = out_dir / f"{file_item.path.stem}{new_ext}"
+            key = os.path.normcase(str(output_path))
+            groups.setdefault(key, []).append((file_item, output_path))
+
+        # pypdf holds the GIL throughout, so PDF conversions running side by
+        # side would only contend with each other and the Tk thread; they
+        # share one task instead
+        tasks: List[List[Tuple[FileItem, Path]]] = []
+        document_items: List[Tuple[FileItem, Path]] = []
+        for items in groups.values():
+            if any(file_item.format_type == "document" for file_item, _ in items):
+                document_items.extend(items)
+            else:
+                tasks.append(items)
+        if document_items:
+            tasks.append(document_items)
+
+        workers = min(MAX_CONVERSION_WORKERS, len(tasks)) or 1
+
+        # Progress callback, throttled: converters may report every chunk,
+        # far more often than the progress bar can usefully repaint
+        last_post = 0.0
+        last_pct = -1
+
+        cancel_event = self._cancel_event
+
+        def progress_callback(current: int, total: int, message: str):
+            nonlocal last_post, last_pct
+            # Converters report progress from inside their work loops, which
+            # makes this the place to stop a long single-file conversion
+            if cancel_event.is_set():
+                raise ConversionCancelled()
+            # With several files in flight, one file's chunk percentage says
+            # nothing about the batch; the bar then advances per file only
+            if total <= 0 or workers > 1:
+                return
+            pct = int(current * 100 / total)
+            now = time.monotonic()
+            if pct == last_pct or now - last_post < PROGRESS_POST_INTERVAL:
+                return
+            last_post = now
+            last_pct = pct
+            self._ui_queue.put(("progress", pct))
+
+        # The pandas conversions hold the GIL for long stretches, so data
+        # files run in worker processes. The pool lives for this batch only,
+        # sized to its data files, and uses "spawn": forking this
+        # multi-threaded Tk process mid-batch is unsafe.
+        data_count = sum(1 for file_item in files if file_item.format_type == "data")
+        if data_count:
+            data_pool = ProcessPoolExecutor(
+                max_workers=min(MAX_CONVERSION_WORKERS, data_count),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        else:
+            data_pool = nullcontext()
+
+        with data_pool, ThreadPoolExecutor(max_workers=workers) as executor:
+            options["data_pool"] = data_pool
+            futures = [
+                executor.submit(self._convert_group, items, options, progress_callback)
+                for items in tasks
+            ]
+
+            completed = 0
+            for future in as_completed(futures):
+                for file_item, succeeded in future.result():
+                    if succeeded is None:
+                        continue  # Skipped after cancellation
+
+                    if succeeded:
+                        success_count += 1
+                        message = f"Converted {file_item.path.name}"
+                    else:
+                        error_count += 1
+                        message = f"Failed to convert {file_item.path.name}"
 
-        for idx, file_item in enumerate(files):
-            if self._cancel_requested:
-                break
+                    self._ui_queue.put(("file", completed, total, message))
+                    completed += 1
+
+        # Conversion complete
+        self._ui_queue.put(("done", success_count, error_count, self._cancel_event.is_set()))
+
+    def _convert_group(
+        self,
+        items: List[Tuple[FileItem, Path]],
+        options: Dict[str, Any],
+        progress_callback: Callable,
+    ) -> List[Tuple[FileItem, Optional[bool]]]:
+        """Convert files sharing an output path, in order, on one worker thread."""
+        return [
+            (file_item, self._convert_one(file_item, output_path, options, progress_callback))
+            for file_item, output_path in items
+        ]
+
+    def _convert_one(
+        self,
+        file_item: FileItem,
+        output_path: Path,
+        options: Dict[str, Any],
+        progress_callback: Callable,
+    ) -> Optional[bool]:
+        """Convert a single file on a worker thread.
+
+        Returns True on success, False on failure, or None if the
+        conversion was cancelled before or during this file.
+        """
+        if self._cancel_event.is_set():
+            return None
+
+        file_path = file_item.path
+
+        # Update status
+        self._ui_queue.put(("status", file_path, "converting", None))
+
+        try:
+            out_dir = output_path.parent
+            out_dir.mkdir(parents=True, exist_ok=True)
+
+            # Perform conversion based on type
+            convert = self._converter_dispatch.get(file_item.format_type)
+            if convert is None:
+                raise ValueError(f"Unknown file type: {file_item.format_type}")
+
+            result = convert(file_item, output_path, out_dir, options, progress_callback)
+
+            # Check result
+            if result.is_success:
+                self._ui_queue.put(("status", file_path, "success", None))
+                return True
 
-            file_path = str(file_item.path)
+            error_msg = result.error_message or "Unknown error"
+            self._ui_queue.put(("status", file_path, "error", error_msg))
+            return False
 
-            # Update status
-            self.root.after(0, lambda f=file_path: self.file_list.update_file_status(f, "converting"))
-            self.root.after(0, lambda i=idx, t=total, n=file_item.path.name: self._update_progress(i, t, f"Converting {n}..."))
+        except ConversionCancelled:
+            self._ui_queue.put(("status", file_path, "pending", None))
+            return None
+
+        except Exception as e:
+            logger.exception(f"Conversion error for {file_path}")
+            self._ui_queue.put(("status", file_path, "error", str(e)))
+            return False
+
+    def _convert_image(
+        self,
+        file_item: FileItem,
+        output_path: Path,
+        out_dir: Path,
+        options: Dict[str, Any],
+        progress_callback: Callable,
+    ):
+        """Convert one image file."""
+        types = self._conv_types
+
+        img_options = types.ImageConversionOptions(
+            quality=options["quality"],
+            width=options["width"],
+            height=options["height"],
+        )
+
+        return self.image_converter.convert(
+            file_item.path,
+            output_path,
+            output_format=(
+                options["image_format"]
+                or types.ImageFormat.from_extension(options["extension"])
+            ),
+            options=img_options,
+            progress_callback=progress_callback,
+        )
+
+    def _convert_document(
+        self,
+        file_item: FileItem,
+        output_path: Path,
+        out_dir: Path,
+        options: Dict[str, Any],
+        progress_callback: Callable,
+    ):
+        """Convert one PDF document."""
+        output_format = options["output_format"]
 
+        if output_format == "TXT":
+            return self.document_converter.pdf_to_text(
+                file_item.path,
+                output_path,
+                progress_callback=progress_callback,
+            )
+        elif output_format == "PNG (pages)":
+            # Output to directory for images
+            return self.document_converter.pdf_to_images(
+                file_item.path,
+                out_dir / file_item.path.stem,
+                progress_callback=progress_callback,
+            )
+        raise ValueError(f"Unsupported document output: {output_format}")
+
+    def _convert_data(
+        self,
+        file_item: FileItem,
+        output_path: Path,
+        out_dir: Path,
+        options: Dict[str, Any],
+        progress_callback: Callable,
+    ):
+        """Convert one data file in the batch's data process pool."""
+        types = self._conv_types
+
+        future = options["data_pool"].submit(
+            types.convert_data_in_process,
+            file_item.path,
+            output_path,
+            options["data_format"] or types.DataFormat.from_extension(options["extension"]),
+            types.DataConversionOptions(),
+        )
+        return future.result()
+
+    def _schedule_drain(self):
+        """Start draining the UI queue, unless a drain is already scheduled."""
+        if not self._draining:
+            self._draining = True
+            self.root.after(UI_POLL_INTERVAL_MS, self._drain_ui_queue)
+
+    def _drain_ui_queue(self):
+        """Apply all updates posted by worker threads since the last tick.
+
+        Runs on the UI thread every UI_POLL_INTERVAL_MS while a conversion
+        or a file scan is in progress. Only the latest status per file and
+        the latest progress value are applied, so a burst of worker
+        messages costs one round of redraws.
+        """
+        scanned: List[FileItem] = []
+        statuses: Dict[Path, Tuple[str, Optional[str]]] = {}
+        file_progress: Optional[Tuple[int, int, str]] = None
+        progress: Optional[float] = None
+        done: Optional[Tuple[int, int, bool]] = None
+
+        while True:
             try:
-                # Determine output path
-                if output_dir:
-                    out_dir = Path(output_dir)
-                else:
-                    out_dir = file_item.path.parent
-
-                out_dir.mkdir(parents=True, exist_ok=True)
-
-                # Get proper extension
-                ext_map = {
-                    "PNG": ".png", "JPG": ".jpg", "JPEG": ".jpg",
-                    "WEBP": ".webp", "BMP": ".bmp", "GIF": ".gif",
-                    "TXT": ".txt", "PNG (pages)": ".png",
-                    "CSV": ".csv", "JSON": ".json", "XLSX": ".xlsx",
-                }
-                new_ext = ext_map.get(output_format, f".{output_format.lower()}")
-                output_path = out_dir / f"{file_item.path.stem}{new_ext}"
-
-                # Progress callback
-                def progress_callback(current: int, total: int, message: str):
-                    if total > 0:
-                        pct = (current / total) * 100
-                        self.root.after(0, lambda p=pct: self.progress_panel.set_progress(p))
-
-                # Perform conversion based on type
-                if file_item.format_type == "image":
-                    img_options = ImageConversionOptions(
-                        quality=options["quality"],
-                        width=options["width"],
-                        height=options["height"],
-                    )
-
-                    result = self.image_converter.convert(
-                        file_item.path,
-                        output_path,
-                        output_format=ImageFormat.from_extension(new_ext),
-                        options=img_options,
-                        progress_callback=progress_callback,
-                    )
-
-                elif file_item.format_type == "document":
-                    if output_format == "TXT":
-                        result = self.document_converter.pdf_to_text(
-                            file_item.path,
-                            output_path,
-                            progress_callback=progress_callback,
-                        )
-                    elif output_format == "PNG (pages)":
-                        # Output to directory for images
-                        result = self.document_converter.pdf_to_images(
-                            file_item.path,
-                            out_dir / file_item.path.stem,
-                            progress_callback=progress_callback,
-                        )
-                    else:
-                        raise ValueError(f"Unsupported document output: {output_format}")
-
-                elif file_item.format_type == "data":
-                    data_options = DataConversionOptions()
-
-                    result = self.data_converter.convert(
-                        file_item.path,
-                        output_path,
-                        output_format=DataFormat.from_extension(new_ext),
-                        options=data_options,
-                        progress_callback=progress_callback,
-                    )
-                else:
-                    raise ValueError(f"Unknown file type: {file_item.format_type}")
-
-                # Check result
-                if result.is_success:
-                    self.root.after(0, lambda f=file_path: self.file_list.update_file_status(f, "success"))
-                    success_count += 1
-                else:
-                    error_msg = result.error_message or "Unknown error"
-                    self.root.after(0, lambda f=file_path, e=error_msg: self.file_list.update_file_status(f, "error", e))
-                    error_count += 1
-
-            except Exception as e:
-                logger.exception(f"Conversion error for {file_path}")
-                error_msg = str(e)
-                self.root.after(0, lambda f=file_path, e=error_msg: self.file_list.update_file_status(f, "error", e))
-                error_count += 1
+                message = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
 
-        # Conversion complete
-        self.root.after(0, lambda: self._conversion_complete(success_count, error_count, self._cancel_requested))
+            # Index/slice the message tuple rather than star-unpacking it,
+            # which would build a throwaway list per message
+            kind = message[0]
+            if kind == "status":
+                statuses[message[1]] = message[2:]
+            elif kind == "file":
+                file_progress = message[1:]
+                progress = None  # Superseded by the new file's overall progress
+            elif kind == "progress":
+                progress = message[1]
+            elif kind == "done":
+                done = message[1:]
+            elif kind == "scanned":
+                self._scans_in_flight -= 1
+                if message[1] == self._scan_generation:
+                    scanned.extend(message[2])
+
+        if scanned:
+            self._on_files_scanned(scanned)
+        for file_path, (status, error) in statuses.items():
+            self.file_list.update_file_status(file_path, status, error)
+        if file_progress is not None:
+            self._update_progress(*file_progress)
+        if progress is not None:
+            self.progress_panel.set_progress(progress)
+
+        if done is not None:
+            self._conversion_complete(*done)
+
+        if self._is_converting or self._scans_in_flight:
+            self.root.after(UI_POLL_INTERVAL_MS, self._drain_ui_queue)
+        else:
+            self._draining = False
 
     def _update_progress(self, current: int, total: int, message: str):
         """Update progress panel from main thread."""
-        if total > 0:
-            percent = ((current + 1) / total) * 100
-            self.progress_panel.set_progress(percent)
-        self.progress_panel.set_status(message)
-        self.progress_panel.set_details(f"File {current + 1} of {total}")
+        self.progress_panel.update_fields(
+            status=message,
+            progress=((current + 1) / total) * 100 if total > 0 else None,
+            details=f"File {current + 1} of {total}",
+        )
 
     def _conversion_complete(self, success: int, errors: int, cancelled: bool):
         """Handle conversion completion."""
@@ -1687,8 +2094,10 @@ class FileForgeApp:
             self.progress_panel.set_status("Conversion cancelled")
             messagebox.showinfo("Cancelled", "Conversion was cancelled.")
         elif errors == 0:
-            self.progress_panel.set_status(f"Completed! {success} file(s) converted successfully.")
-            self.progress_panel.set_progress(100)
+            self.progress_panel.update_fields(
+                status=f"Completed! {success} file(s) converted successfully.",
+                progress=100,
+            )
             messagebox.showinfo("Success", f"Successfully converted {success} file(s)!")
         else:
             self.progress_panel.set_status(f"Completed with {errors} error(s). {success} succeeded.")
@@ -1700,7 +2109,7 @@ class FileForgeApp:
     def _cancel_conversion(self):
         """Cancel the current conversion."""
         if self._is_converting:
-            self._cancel_requested = True
+            self._cancel_event.set()
             self.progress_panel.set_status("Cancelling...")
 
     def _set_ui_state(self, enabled: bool):
@@ -1721,6 +2130,10 @@ class FileForgeApp:
 
 def main():
     """Main entry point for the FileForge GUI."""
+    # In frozen builds, data conversion workers re-run this entry point;
+    # this turns them into workers instead of opening another window
+    multiprocessing.freeze_support()
+
     # Try to use tkinterdnd2 for drag and drop support
     try:
         from tkinterdnd2 import TkinterDnD
@@ -7,13 +7,31 @@ Starts both the FastAPI backend and React frontend development servers.
 import subprocess
 import sys
 import os
-import signal
+import json
+import importlib.util
+import selectors
+import shutil
+import socket
 import time
-import platform
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Colors for terminal output
-class Colors:
+_IS_WINDOWS = sys.platform == "win32"
+
+# Python packages the backend needs
+REQUIRED = ("fastapi", "uvicorn", "PIL", "pypdf", "pandas")
+
+# Tool versions from previous launches, keyed on the binary's path and stat
+DEPS_CACHE = Path.home() / ".cache" / "fileforge" / "deps.json"
+
+# Resolved once so every launch runs the binaries directly, without cmd.exe
+_NODE = shutil.which("node")
+_NPM = shutil.which("npm.cmd") or shutil.which("npm")
+
+# Colors for terminal output; empty when stdout isn't a terminal so piped
+# output stays clean
+if sys.stdout.isatty():
     HEADER = '\033[95m'
     BLUE = '\033[94m'
     CYAN = '\033[96m'
@@ -22,11 +40,21 @@ class Colors:
     RED = '\033[91m'
     END = '\033[0m'
     BOLD = '\033[1m'
+else:
+    HEADER = BLUE = CYAN = GREEN = YELLOW = RED = END = BOLD = ''
 
-def print_banner():
-    """Print the FileForge banner."""
-    banner = f"""
-{Colors.CYAN}{Colors.BOLD}
+def _write_static(data):
+    """Write pre-rendered output in a single call."""
+    sys.stdout.flush()
+    if _IS_WINDOWS:
+        # Only sys.stdout's console layer translates Unicode correctly
+        sys.stdout.write(data.decode("utf-8"))
+        sys.stdout.flush()
+    else:
+        os.write(sys.stdout.fileno(), data)
+
+_BANNER = f"""
+{CYAN}{BOLD}
     ╔═══════════════════════════════════════════════════════════╗
     ║                                                           ║
     ║   ███████╗██╗██╗     ███████╗███████╗ ██████╗ ██████╗ ███████╗   ║
@@ -38,148 +66,402 @@ def print_banner():
     ║                                                           ║
     ║              Modern File Converter Web App                ║
     ╚═══════════════════════════════════════════════════════════╝
-{Colors.END}"""
-    print(banner)
+{END}
+""".encode("utf-8")
 
-def check_dependencies():
-    """Check if required dependencies are available."""
-    print(f"{Colors.YELLOW}Checking dependencies...{Colors.END}")
+_RUNNING_BOX = f"""
+{GREEN}{BOLD}FileForge is running!{END}
 
-    # Check Python packages
-    try:
-        import fastapi
-        import uvicorn
-        import PIL
-        import pypdf
-        import pandas
-        print(f"  {Colors.GREEN}✓{Colors.END} Python packages installed")
-    except ImportError as e:
-        print(f"  {Colors.RED}✗{Colors.END} Missing Python package: {e.name}")
-        print(f"    Run: pip install -r requirements.txt")
-        return False
+{CYAN}╭─────────────────────────────────────────────────╮
+│                                                 │
+│   Frontend:  http://localhost:3000              │
+│   Backend:   http://localhost:8000              │
+│   API Docs:  http://localhost:8000/docs         │
+│                                                 │
+│   Press Ctrl+C to stop all servers              │
+│                                                 │
+╰─────────────────────────────────────────────────╯{END}
 
-    # Check Node.js
+""".encode("utf-8")
+
+def print_banner():
+    """Print the FileForge banner."""
+    _write_static(_BANNER)
+
+def _probe(cmd):
+    """Run a version command, returning (ok, version_or_error)."""
     try:
         result = subprocess.run(
-            ["node", "--version"],
+            cmd,
             capture_output=True,
-            text=True,
-            shell=platform.system() == "Windows"
+            text=True
         )
-        if result.returncode == 0:
-            print(f"  {Colors.GREEN}✓{Colors.END} Node.js {result.stdout.strip()}")
-        else:
-            raise FileNotFoundError
-    except FileNotFoundError:
-        print(f"  {Colors.RED}✗{Colors.END} Node.js not found")
-        print(f"    Install Node.js from https://nodejs.org/")
-        return False
+    except OSError as e:
+        return False, str(e)
+    if result.returncode != 0:
+        return False, result.stderr.strip()
+    return True, result.stdout.strip()
 
-    # Check npm
+def _load_deps_cache():
+    """Load cached tool versions, or an empty cache if unreadable."""
     try:
-        result = subprocess.run(
-            ["npm", "--version"],
-            capture_output=True,
-            text=True,
-            shell=platform.system() == "Windows"
-        )
-        if result.returncode == 0:
-            print(f"  {Colors.GREEN}✓{Colors.END} npm {result.stdout.strip()}")
+        with open(DEPS_CACHE, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def _save_deps_cache(cache):
+    """Write the version cache atomically; failures are not fatal."""
+    tmp_path = DEPS_CACHE.with_suffix(".tmp")
+    try:
+        DEPS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, DEPS_CACHE)
+    except OSError:
+        pass
+
+def _tool_version(tool_path, cache):
+    """
+    Return (ok, version_or_error) for a tool resolved on PATH.
+
+    The version is only probed when the binary's path, mtime or size
+    changed since the last launch; otherwise it comes from the cache.
+    """
+    if tool_path is None:
+        return False, "not found on PATH"
+    try:
+        st = os.stat(tool_path)
+    except OSError as e:
+        return False, str(e)
+
+    key = f"{tool_path}|{st.st_mtime_ns}|{st.st_size}"
+    if key in cache:
+        return True, cache[key]
+
+    ok, version = _probe([tool_path, "--version"])
+    if ok:
+        cache[key] = version
+    return ok, version
+
+def check_dependencies():
+    """Check if required dependencies are available."""
+    # Collect the report and write it in one go once the checks finish
+    lines = [f"{YELLOW}Checking dependencies...{END}"]
+    try:
+        # Check Python packages; find_spec locates them without importing
+        missing = [name for name in REQUIRED if importlib.util.find_spec(name) is None]
+        if missing:
+            lines.append(f"  {RED}✗{END} Missing Python packages: {', '.join(missing)}")
+            lines.append(f"    Run: pip install -r requirements.txt")
+            return False
+        lines.append(f"  {GREEN}✓{END} Python packages installed")
+
+        # Check Node.js and npm; on a cache miss each probe is an
+        # independent process launch, so run them side by side
+        cache = _load_deps_cache()
+        cached_keys = len(cache)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            (node_ok, node_version), (npm_ok, npm_version) = executor.map(
+                lambda tool_path: _tool_version(tool_path, cache), (_NODE, _NPM)
+            )
+        if len(cache) != cached_keys:
+            _save_deps_cache(cache)
+
+        if node_ok:
+            lines.append(f"  {GREEN}✓{END} Node.js {node_version}")
         else:
-            raise FileNotFoundError
-    except FileNotFoundError:
-        print(f"  {Colors.RED}✗{Colors.END} npm not found")
-        return False
+            lines.append(f"  {RED}✗{END} Node.js not found")
+            lines.append(f"    Install Node.js from https://nodejs.org/")
+            return False
 
-    return True
+        if npm_ok:
+            lines.append(f"  {GREEN}✓{END} npm {npm_version}")
+        else:
+            lines.append(f"  {RED}✗{END} npm not found")
+            return False
+
+        return True
+    finally:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+def _node_modules_installed(node_modules: Path):
+    """Check node_modules is non-empty and npm finished writing it."""
+    try:
+        with os.scandir(node_modules) as it:
+            if next(it, None) is None:
+                return False
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+    # npm writes this lockfile copy last, so a missing one means an
+    # interrupted install
+    return os.path.isfile(node_modules / ".package-lock.json")
 
 def install_frontend_deps(frontend_path: Path):
-    """Install frontend dependencies if node_modules doesn't exist."""
+    """Install frontend dependencies if node_modules is missing or incomplete."""
     node_modules = frontend_path / "node_modules"
 
-    if not node_modules.exists():
-        print(f"\n{Colors.YELLOW}Installing frontend dependencies...{Colors.END}")
+    if not _node_modules_installed(node_modules):
+        print(f"\n{YELLOW}Installing frontend dependencies...{END}")
+
+        # Piped output and no progress bar keep npm from repainting the
+        # terminal throughout the install
+        env = os.environ.copy()
+        env["NPM_CONFIG_PROGRESS"] = "false"
+        env["NPM_CONFIG_FUND"] = "false"
+        env["NPM_CONFIG_AUDIT"] = "false"
         result = subprocess.run(
-            ["npm", "install"],
-            cwd=frontend_path,
-            shell=platform.system() == "Windows"
+            [_NPM, "install"],
+            cwd=str(frontend_path),
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            encoding="utf-8",
+            errors="replace",
+            shell=False
         )
+        lines = [line for line in result.stdout.splitlines() if line.strip()]
         if result.returncode != 0:
-            print(f"{Colors.RED}Failed to install frontend dependencies{Colors.END}")
+            print("\n".join(lines[-20:]))
+            print(f"{RED}Failed to install frontend dependencies{END}")
             return False
-        print(f"{Colors.GREEN}Frontend dependencies installed!{Colors.END}")
+        if lines:
+            print(f"  {lines[-1].strip()}")
+        print(f"{GREEN}Frontend dependencies installed!{END}")
 
     return True
 
+def _signal_on_exit(process: subprocess.Popen, exited: threading.Event):
+    """Block until the process exits, then set the shared event."""
+    process.wait()
+    exited.set()
+
+def _wait_for_exit(processes):
+    """
+    Block until any of the processes exits.
+
+    On Linux each child gets a pidfd, which becomes readable when it
+    exits, so one selector waits on all of them in the kernel. Elsewhere
+    one watcher thread per child blocks in wait() and sets a shared event.
+    """
+    if hasattr(os, "pidfd_open"):
+        pidfds = []
+        try:
+            for name, process in processes:
+                pidfds.append(os.pidfd_open(process.pid))
+        except OSError:
+            # Kernels before 5.3 lack pidfd_open
+            for fd in pidfds:
+                os.close(fd)
+        else:
+            try:
+                with selectors.DefaultSelector() as selector:
+                    for fd in pidfds:
+                        selector.register(fd, selectors.EVENT_READ)
+                    selector.select()
+            finally:
+                for fd in pidfds:
+                    os.close(fd)
+            return
+
+    exited = threading.Event()
+    for name, process in processes:
+        threading.Thread(
+            target=_signal_on_exit,
+            args=(process, exited),
+            daemon=True
+        ).start()
+
+    # An untimed wait can't be interrupted by Ctrl+C on Windows
+    timeout = 1 if _IS_WINDOWS else None
+    while not exited.wait(timeout):
+        pass
+
+def _server_cores():
+    """
+    Split the usable cores into (backend, frontend) halves, so the two dev
+    servers' reload bursts don't compete for the same cores and cache.
+
+    Returns None on platforms without sched_setaffinity, on machines with
+    fewer than 4 usable cores, or when FILEFORGE_NO_AFFINITY is set.
+    """
+    if not hasattr(os, "sched_setaffinity") or os.environ.get("FILEFORGE_NO_AFFINITY"):
+        return None
+    cores = sorted(os.sched_getaffinity(0))
+    if len(cores) < 4:
+        return None
+    half = len(cores) // 2
+    return cores[:half], cores[half:]
+
+def _popen_on_cores(cores, *args, **kwargs):
+    """
+    Start a process restricted to the given cores.
+
+    The launcher's own affinity is narrowed around the spawn: the child
+    inherits it, and so does every thread and process it starts later
+    (uvicorn's reload worker, Vite, esbuild), which pinning the child's
+    pid afterwards would miss.
+    """
+    if cores is None:
+        return subprocess.Popen(*args, **kwargs)
+    original = os.sched_getaffinity(0)
+    try:
+        os.sched_setaffinity(0, cores)
+    except OSError:
+        return subprocess.Popen(*args, **kwargs)
+    try:
+        return subprocess.Popen(*args, **kwargs)
+    finally:
+        os.sched_setaffinity(0, original)
+
+def _wait_port(host, port, deadline, process):
+    """
+    Poll until something accepts connections on host:port, with backoff.
+
+    Gives up early if the process that should be listening exits.
+    """
+    delay = 0.01
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            return False
+        with socket.socket() as s:
+            s.settimeout(0.2)
+            if s.connect_ex((host, port)) == 0:
+                return True
+        time.sleep(delay)
+        delay = min(delay * 2, 0.5)
+    return False
+
+# Starts uvicorn directly instead of through `-m uvicorn`, skipping runpy
+# and the command-line parser
+_BACKEND_BOOT = (
+    "import uvicorn; "
+    "uvicorn.run('main:app', host='0.0.0.0', port=8000, reload=True)"
+)
+
+# Each server leads its own process group so shutdown signals also reach
+# uvicorn's reload worker and the node process behind npm
+if _IS_WINDOWS:
+    _SPAWN_GROUP = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    _SPAWN_GROUP = {"start_new_session": True}
+
+def _signal_groups(processes, sig):
+    """Send a signal to every server's process group, ignoring ones that are gone."""
+    for name, process in processes:
+        try:
+            os.killpg(process.pid, sig)
+        except OSError:
+            pass
+
+def _print_quietly(text):
+    """Print, ignoring a terminal that has gone away (e.g. after SIGHUP)."""
+    try:
+        print(text, flush=True)
+    except OSError:
+        pass
+
+def _raise_interrupt(signum, frame):
+    """Route SIGHUP/SIGTERM through the same shutdown path as Ctrl+C."""
+    raise KeyboardInterrupt
+
 def start_servers():
     """Start both backend and frontend servers."""
+    # Only server supervision needs signals
+    import signal
+
     base_path = Path(__file__).parent
     backend_path = base_path / "backend"
     frontend_path = base_path / "frontend"
 
     processes = []
+    backend_cores, frontend_cores = _server_cores() or (None, None)
+
+    if not _IS_WINDOWS:
+        # The servers run in their own sessions, so a closed terminal or a
+        # kill reaches only the launcher; either must still stop them
+        for sig in (signal.SIGHUP, signal.SIGTERM):
+            signal.signal(sig, _raise_interrupt)
 
     try:
         # Start backend server
-        print(f"\n{Colors.BLUE}Starting backend server on http://localhost:8000{Colors.END}")
-        backend_process = subprocess.Popen(
-            [sys.executable, "-m", "uvicorn", "main:app", "--reload", "--host", "0.0.0.0", "--port", "8000"],
+        print(f"\n{BLUE}Starting backend server on http://localhost:8000{END}")
+        backend_process = _popen_on_cores(
+            backend_cores,
+            [sys.executable, "-c", _BACKEND_BOOT],
             cwd=backend_path,
-            shell=False
+            shell=False,
+            **_SPAWN_GROUP
         )
         processes.append(("Backend", backend_process))
 
-        # Give backend a moment to start
-        time.sleep(2)
+        # Wait until the backend accepts connections before starting the
+        # frontend, instead of sleeping a fixed amount
+        if not _wait_port("127.0.0.1", 8000, time.monotonic() + 10, backend_process):
+            if backend_process.poll() is not None:
+                print(f"{RED}Backend server exited during startup (code {backend_process.returncode}){END}")
+            else:
+                print(f"{RED}Backend did not start listening on port 8000 within 10 seconds{END}")
+            raise KeyboardInterrupt
 
         # Start frontend server
-        print(f"{Colors.BLUE}Starting frontend server on http://localhost:3000{Colors.END}")
-
-        # Use npm.cmd on Windows, npm on Unix
-        npm_cmd = "npm.cmd" if platform.system() == "Windows" else "npm"
-        frontend_process = subprocess.Popen(
-            [npm_cmd, "run", "dev"],
+        print(f"{BLUE}Starting frontend server on http://localhost:3000{END}")
+        frontend_process = _popen_on_cores(
+            frontend_cores,
+            [_NPM, "run", "dev"],
             cwd=frontend_path,
-            shell=False
+            shell=False,
+            **_SPAWN_GROUP
         )
         processes.append(("Frontend", frontend_process))
 
-        print(f"\n{Colors.GREEN}{Colors.BOLD}FileForge is running!{Colors.END}")
-        print(f"""
-{Colors.CYAN}╭─────────────────────────────────────────────────╮
-│                                                 │
-│   Frontend:  http://localhost:3000              │
-│   Backend:   http://localhost:8000              │
-│   API Docs:  http://localhost:8000/docs         │
-│                                                 │
-│   Press Ctrl+C to stop all servers              │
-│                                                 │
-╰─────────────────────────────────────────────────╯{Colors.END}
-""")
+        _write_static(_RUNNING_BOX)
 
-        # Wait for processes
-        while True:
-            for name, process in processes:
-                if process.poll() is not None:
-                    print(f"{Colors.RED}{name} server stopped unexpectedly{Colors.END}")
-                    raise KeyboardInterrupt
-            time.sleep(1)
+        # Sleep until a server actually exits
+        _wait_for_exit(processes)
+
+        for name, process in processes:
+            if process.poll() is not None:
+                print(f"{RED}{name} server stopped unexpectedly{END}")
+        raise KeyboardInterrupt
 
     except KeyboardInterrupt:
-        print(f"\n{Colors.YELLOW}Shutting down servers...{Colors.END}")
+        # Signal the servers before printing anything, and print through
+        # _print_quietly: after a hangup, writing to the closed terminal
+        # fails, and that must not skip the reaping below
+        if _IS_WINDOWS:
+            for name, process in processes:
+                try:
+                    process.send_signal(signal.CTRL_BREAK_EVENT)
+                except OSError:
+                    pass
+        else:
+            # A repeated SIGHUP/SIGTERM must not cut the shutdown short
+            for sig in (signal.SIGHUP, signal.SIGTERM):
+                signal.signal(sig, signal.SIG_IGN)
+            # SIGINT first so both servers shut down as they would on Ctrl+C
+            _signal_groups(processes, signal.SIGINT)
+            time.sleep(0.2)
+            _signal_groups(processes, signal.SIGTERM)
+        _print_quietly(f"\n{YELLOW}Shutting down servers...{END}")
+
+        # All servers share one grace period, so a slow backend doesn't
+        # delay noticing that the frontend is already gone
+        deadline = time.monotonic() + 5
         for name, process in processes:
             try:
-                if platform.system() == "Windows":
-                    process.terminate()
+                process.wait(timeout=max(0, deadline - time.monotonic()))
+                _print_quietly(f"  {GREEN}✓{END} {name} stopped")
+            except subprocess.TimeoutExpired:
+                if _IS_WINDOWS:
+                    process.kill()
                 else:
-                    os.killpg(os.getpgid(process.pid), signal.SIGTERM)
-                process.wait(timeout=5)
-                print(f"  {Colors.GREEN}✓{Colors.END} {name} stopped")
-            except Exception as e:
-                process.kill()
-                print(f"  {Colors.YELLOW}!{Colors.END} {name} force killed")
+                    _signal_groups([(name, process)], signal.SIGKILL)
+                _print_quietly(f"  {YELLOW}!{END} {name} force killed")
 
-        print(f"\n{Colors.GREEN}Goodbye!{Colors.END}")
+        _print_quietly(f"\n{GREEN}Goodbye!{END}")
 
 def main():
     """Main entry point."""
@@ -190,7 +472,7 @@ def main():
 
     # Check dependencies
     if not check_dependencies():
-        print(f"\n{Colors.RED}Please install missing dependencies and try again.{Colors.END}")
+        print(f"\n{RED}Please install missing dependencies and try again.{END}")
         sys.exit(1)
 
     # Install frontend deps if needed